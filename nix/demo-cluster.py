@@ -47,9 +47,8 @@ def deploy(network_path, id):
     api = k8s()
 
     if id is None:
-        chainspec = toml.load(
-            open(os.path.join(network_path, "chain", "chainspec.toml"))
-        )
+        with open(os.path.join(network_path, "chain", "chainspec.toml")) as f:
+            chainspec = toml.load(f)
         name = name = NETWORK_NAME_PREFIX + chainspec["genesis"]["name"]
     else:
         name = NETWORK_NAME_PREFIX + id
@@ -158,7 +157,8 @@ def xz_dir(target):
                     tar.add(full_path, arcname=relpath)
 
         archive.close()
-        return open(archive.name, "rb").read()
+        with open(archive.name, "rb") as f:
+            return f.read()
 
 
 if __name__ == "__main__":
@@ -180,7 +180,8 @@ def create_network(
     )
 
     chainspec_path = os.path.join(chain_path, "chainspec.toml")
-    toml.dump(chainspec, open(chainspec_path, "w"))
+    with open(chainspec_path, "w") as f:
+        toml.dump(chainspec, f)
     show_val("Chainspec", chainspec_path)
 
     # Setup each node, collecting all pubkey hashes.
@@ -211,7 +212,8 @@ def create_network(
 
     accounts_path = os.path.join(chain_path, "accounts.toml")
     show_val("accounts file", accounts_path)
-    create_accounts_toml(open(accounts_path, "w"), pubkeys)
+    with open(accounts_path, "w") as f:
+        create_accounts_toml(f, pubkeys)
 
 
 def create_chainspec(template, network_name, genesis_in, contract_paths):
@@ -223,7 +225,8 @@ def create_chainspec(template, network_name, genesis_in, contract_paths):
     Returns a dictionary that can be serialized using `toml`.
     """
     show_val("Chainspec template", template)
-    chainspec = toml.load(open(template))
+    with open(template) as f:
+        chainspec = toml.load(f)
 
     show_val("Chain name", network_name)
     genesis_timestamp = (datetime.utcnow() + timedelta(seconds=genesis_in)).isoformat(
@@ -256,7 +259,8 @@ def create_node(
     key_path = os.path.join(node_path, "keys")
     run_client(client_argv0, "keygen", key_path)
 
-    config = toml.load(open(config_template))
+    with open(config_template) as f:
+        config = toml.load(f)
     config["node"]["chainspec_config_path"] = "../chain/chainspec.toml"
 
     config["consensus"]["secret_key_path"] = os.path.join(
@@ -285,9 +289,11 @@ def create_node(
         config["storage"]["path"] = "/storage"
         config["consensus"]["unit_hashes_folder"] = "/storage"
 
-    toml.dump(config, open(os.path.join(node_path, "config.toml"), "w"))
+    with open(os.path.join(node_path, "config.toml"), "w") as f:
+        toml.dump(config, f)
 
-    return open(os.path.join(key_path, "public_key_hex")).read().strip()
+    with open(os.path.join(key_path, "public_key_hex")) as f:
+        return f.read().strip()
 
 
 def create_accounts_toml(output_file, pubkeys):